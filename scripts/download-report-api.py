@@ -1,87 +1,150 @@
 #!/usr/bin/env python3
 """
-Download REPORT.md from Semaphore workflow using direct API calls.
+Download REPORT.md from Semaphore workflows using direct API calls.
+
+Multiple workflow IDs are downloaded concurrently over a shared
+connection pool; each report is saved to REPORT-<workflow-id>.md unless
+an explicit output file is given for a single workflow.
 
 Usage:
     export SEMAPHORE_API_TOKEN="your-token"
     python3 download-report-api.py <workflow-id> [output-file]
+    python3 download-report-api.py <workflow-id> <workflow-id> ...
 """
 
+import asyncio
 import os
 import sys
-import requests
+import uuid
 
-def download_report(workflow_id, output_file="REPORT.md"):
-    """Download REPORT.md from Semaphore workflow."""
+import aiofiles
+import aiohttp
 
-    # Get API token from environment
-    api_token = os.environ.get("SEMAPHORE_API_TOKEN")
-    if not api_token:
-        print("Error: SEMAPHORE_API_TOKEN environment variable not set")
-        sys.exit(1)
+# Semaphore self-hosted instance
+BASE_URL = "https://semaphore.hamir.online"
+
+CHUNK_SIZE = 65536
+
+PREVIEW_BYTES = 8192
 
-    # Semaphore self-hosted instance
-    base_url = "https://semaphore.hamir.online"
 
+async def download_report_async(session, workflow_id, output_file):
+    """Download REPORT.md for one workflow, streaming to disk.
+
+    Returns the size of the downloaded file in bytes.
+    """
     # The artifact was pushed to: artifacts/workflows/{workflow_id}/.semaphore/REPORT.md
     artifact_path = f"artifacts/workflows/{workflow_id}/.semaphore/REPORT.md"
-    artifact_url = f"{base_url}/{artifact_path}"
+    artifact_url = f"{BASE_URL}/{artifact_path}"
 
-    print(f"=== Semaphore Report Downloader ===")
-    print(f"Workflow ID: {workflow_id}")
-    print(f"Artifact URL: {artifact_url}")
-    print(f"Output file: {output_file}")
-    print()
+    async with session.get(artifact_url) as response:
+        response.raise_for_status()
+        async with aiofiles.open(output_file, 'wb') as f:
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                await f.write(chunk)
+
+    return os.path.getsize(output_file)
 
-    # Try to download the artifact
-    print("Downloading report...")
+
+async def download_reports(api_token, jobs):
+    """Download all (workflow_id, output_file) jobs concurrently."""
     headers = {
         "Authorization": f"Token {api_token}"
     }
+    connector = aiohttp.TCPConnector(limit_per_host=64)
+    async with aiohttp.ClientSession(
+        connector=connector,
+        headers=headers,
+        timeout=aiohttp.ClientTimeout(total=30),
+    ) as session:
+        return await asyncio.gather(
+            *[download_report_async(session, workflow_id, output_file)
+              for workflow_id, output_file in jobs]
+        )
+
+
+def show_preview(output_file):
+    """Print the first PREVIEW_BYTES bytes of a downloaded report."""
+    print(f"Preview (first {PREVIEW_BYTES // 1024} KiB):")
+    print("-" * 80)
+    sys.stdout.flush()
+    with open(output_file, 'rb') as f:
+        try:
+            # Zero-copy kernel-side transfer on Linux.
+            os.sendfile(sys.stdout.buffer.fileno(), f.fileno(), 0, PREVIEW_BYTES)
+        except (AttributeError, OSError):
+            # sendfile unavailable or stdout does not accept it; copy
+            # the same byte range through userspace.
+            sys.stdout.buffer.write(f.read(PREVIEW_BYTES))
+            sys.stdout.buffer.flush()
+    print("-" * 80)
+
+
+def download_report(jobs):
+    """Download REPORT.md for each (workflow_id, output_file) job."""
 
-    try:
-        response = requests.get(artifact_url, headers=headers, timeout=30)
-        response.raise_for_status()
+    # Get API token from environment
+    api_token = os.environ.get("SEMAPHORE_API_TOKEN")
+    if not api_token:
+        print("Error: SEMAPHORE_API_TOKEN environment variable not set")
+        sys.exit(1)
+
+    print(f"=== Semaphore Report Downloader ===")
+    for workflow_id, output_file in jobs:
+        print(f"Workflow ID: {workflow_id}")
+        print(f"Output file: {output_file}")
+    print()
 
-        # Save to file
-        with open(output_file, 'wb') as f:
-            f.write(response.content)
+    print("Downloading report(s)...")
+    try:
+        sizes = asyncio.run(download_reports(api_token, jobs))
+    except aiohttp.ClientResponseError as e:
+        print(f"HTTP Error: {e.status} {e.message} ({e.request_info.url})")
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
 
-        file_size = len(response.content)
+    for (workflow_id, output_file), file_size in zip(jobs, sizes):
         print(f"✓ Report downloaded successfully!")
         print(f"  Size: {file_size} bytes")
         print(f"  Saved to: {output_file}")
         print()
 
         # Show preview
-        print("Preview (first 50 lines):")
-        print("-" * 80)
-        with open(output_file, 'r') as f:
-            for i, line in enumerate(f):
-                if i >= 50:
-                    break
-                print(line, end='')
-        print("-" * 80)
-
-    except requests.exceptions.HTTPError as e:
-        print(f"HTTP Error: {e}")
-        print(f"Response: {response.text}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"Error: {e}")
-        sys.exit(1)
+        show_preview(output_file)
+
+
+def _is_workflow_id(arg):
+    """Return True if arg parses as a workflow ID (a UUID)."""
+    try:
+        uuid.UUID(arg)
+    except ValueError:
+        return False
+    return True
 
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print(f"Usage: {sys.argv[0]} <workflow-id> [output-file]")
+        print(f"       {sys.argv[0]} <workflow-id> <workflow-id> ...")
+        print()
+        print("A second argument that is not a workflow ID (UUID) is taken")
+        print("as the output file for a single download.")
         print()
         print("Example:")
         print(f"  export SEMAPHORE_API_TOKEN='your-token'")
         print(f"  {sys.argv[0]} d41afe3f-9489-43c8-aaec-0d54c939d6b4")
         sys.exit(1)
 
-    workflow_id = sys.argv[1]
-    output_file = sys.argv[2] if len(sys.argv) > 2 else "REPORT.md"
-
-    download_report(workflow_id, output_file)
+    args = sys.argv[1:]
+    if len(args) == 1:
+        jobs = [(args[0], "REPORT.md")]
+    elif len(args) == 2 and not _is_workflow_id(args[1]):
+        # Legacy single-workflow form: <workflow-id> <output-file>
+        jobs = [(args[0], args[1])]
+    else:
+        jobs = [(workflow_id, f"REPORT-{workflow_id}.md")
+                for workflow_id in args]
+
+    download_report(jobs)